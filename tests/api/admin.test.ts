@@ -1,26 +1,16 @@
 import { describe, it, expect, beforeAll } from 'vitest';
-import { api, login } from './client';
+import { api, login, paths } from './client';
 
 describe('Admin API', () => {
   beforeAll(async () => {
     await login(); // testuser is admin
   });
 
-  describe('POST /api/admin/scan', () => {
-    it('triggers library scan and returns results', async () => {
-      const response = await api.post('/api/admin/scan');
-
-      expect(response.status).toBe(200);
-
-      const result = await response.json();
-      expect(result).toHaveProperty('titles');
-      expect(typeof result.titles).toBe('number');
-    });
-  });
+  // POST /api/admin/scan is tested in progress.test.ts (see the note there)
 
   describe('GET /api/admin/users', () => {
     it('returns list of users', async () => {
-      const response = await api.get('/api/admin/users');
+      const response = await api.get(paths.adminUsers);
 
       expect(response.status).toBe(200);
 
@@ -1,5 +1,5 @@
 import { describe, it, expect, beforeEach } from 'vitest';
-import { api, login, logout, getSessionCookie, BASE_URL } from './client';
+import { api, login, freshLogin, logout, getSessionCookie, paths, BASE_URL } from './client';
 
 describe('Auth API', () => {
   beforeEach(() => {
@@ -66,12 +66,13 @@ describe('Auth API', () => {
 
   describe('GET /logout', () => {
     it('clears session and redirects to login page', async () => {
-      await login();
-      const sessionCookie = getSessionCookie();
+      // Own session: logging out the shared one would break every later test
+      await freshLogin();
+      const sessionCookie = getSessionCookie()!;
       expect(sessionCookie).toBeTruthy();
 
       const response = await fetch(`${BASE_URL}/logout`, {
-        headers: { Cookie: sessionCookie! },
+        headers: { Cookie: sessionCookie },
         redirect: 'manual',
       });
 
@@ -79,8 +80,8 @@ describe('Auth API', () => {
       expect(response.headers.get('location')).toBe('/login');
 
       // Verify old session is actually invalidated
-      const verifyResponse = await fetch(`${BASE_URL}/api/library`, {
-        headers: { Cookie: sessionCookie! },
+      const verifyResponse = await fetch(`${BASE_URL}${paths.library}`, {
+        headers: { Cookie: sessionCookie },
         redirect: 'manual',
       });
       expect(verifyResponse.status).toBe(303);
@@ -98,7 +99,7 @@ describe('Auth API', () => {
 
   describe('Protected routes', () => {
     it('unauthenticated request to /api/library redirects to login', async () => {
-      const response = await fetch(`${BASE_URL}/api/library`, {
+      const response = await fetch(`${BASE_URL}${paths.library}`, {
         redirect: 'manual',
       });
 
@@ -108,7 +109,7 @@ describe('Auth API', () => {
 
     it('authenticated request to /api/library succeeds', async () => {
       await login();
-      const response = await api.get('/api/library');
+      const response = await api.get(paths.library);
 
       expect(response.status).toBe(200);
       expect(response.headers.get('content-type')).toContain('application/json');
@@ -125,7 +126,8 @@ describe('Auth API', () => {
 
     it('authenticated request to home page succeeds', async () => {
       await login();
-      const response = await api.get('/');
+      // HEAD: only status and headers are checked, no need to download the page
+      const response = await api.head('/');
 
       expect(response.status).toBe(200);
       expect(response.headers.get('content-type')).toContain('text/html');
@@ -149,14 +151,14 @@ describe('Auth API', () => {
 
     it('non-admin user gets 403 on /api/admin/users', async () => {
       await login('testuser2', 'testpass123');
-      const response = await api.get('/api/admin/users');
+      const response = await api.get(paths.adminUsers);
 
       expect(response.status).toBe(403);
     });
 
     it('admin user can access /api/admin/users', async () => {
       await login();
-      const response = await api.get('/api/admin/users');
+      const response = await api.get(paths.adminUsers);
 
       expect(response.status).toBe(200);
     });
@@ -199,15 +201,15 @@ describe('Auth API', () => {
     it('session cookie persists across requests', async () => {
       await login();
 
-      const response1 = await api.get('/api/library');
-      const response2 = await api.get('/');
+      const response1 = await api.get(paths.library);
+      const response2 = await api.head('/');
 
       expect(response1.status).toBe(200);
       expect(response2.status).toBe(200);
     });
 
     it('invalid session cookie is rejected', async () => {
-      const response = await fetch(`${BASE_URL}/api/library`, {
+      const response = await fetch(`${BASE_URL}${paths.library}`, {
         headers: { Cookie: 'id=invalid_session_token' },
         redirect: 'manual',
       });
@@ -1,10 +1,10 @@
-// Use explicit port to avoid vitest/vite import.meta.env.BASE_URL conflicts
-const SERVER_PORT = 9000;
-const SERVER_HOST = 'localhost';
-const BASE_URL = `http://${SERVER_HOST}:${SERVER_PORT}`;
+import { inject } from 'vitest';
+import { createSession, REGULAR_USER, TEST_USER } from '../helpers/auth.js';
+import { BASE_URL, paths } from './paths.js';
 
 export interface ApiClient {
   get: (path: string) => Promise<Response>;
+  head: (path: string) => Promise<Response>;
   post: (path: string, body?: unknown) => Promise<Response>;
   put: (path: string, body?: unknown) => Promise<Response>;
   patch: (path: string, body?: unknown) => Promise<Response>;
@@ -12,66 +12,82 @@ export interface ApiClient {
 }
 
 let sessionCookie: string | null = null;
+// Headers only change with the session, so they are built then rather than per request
+let headers: Record<string, string> = buildHeaders(null);
 
-export async function login(username = 'testuser', password = 'testpass123'): Promise<void> {
-  const response = await fetch(`${BASE_URL}/login`, {
-    method: 'POST',
-    headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
-    body: new URLSearchParams({ username, password }),
-    redirect: 'manual',
-  });
-
-  const setCookie = response.headers.get('set-cookie');
-  if (setCookie) {
-    sessionCookie = setCookie.split(';')[0];
+function buildHeaders(cookie: string | null): Record<string, string> {
+  const built: Record<string, string> = { 'Content-Type': 'application/json' };
+  if (cookie) {
+    built['Cookie'] = cookie;
   }
+  return built;
+}
 
-  if (!sessionCookie) {
-    throw new Error(`Login failed for user '${username}': no session cookie returned`);
-  }
+function setSessionCookie(cookie: string | null): void {
+  sessionCookie = cookie;
+  headers = buildHeaders(cookie);
 }
 
-export function logout(): void {
-  sessionCookie = null;
+/**
+ * Use the session created for `username` during global setup.
+ * The shared session is only handed out for the known test credentials; anything
+ * else (other users, wrong passwords) goes through a real login.
+ */
+export async function login(username = 'testuser', password = 'testpass123'): Promise<void> {
+  const known = [TEST_USER, REGULAR_USER].find((user) => user.username === username);
+  const shared = known?.password === password ? inject('sessionCookies')[username] : undefined;
+  setSessionCookie(shared ?? await createSession(BASE_URL, { username, password }));
 }
 
-export function getSessionCookie(): string | null {
-  return sessionCookie;
+/**
+ * Log in with a new session that no other test shares.
+ * Use before anything that invalidates the session, such as GET /logout.
+ */
+export async function freshLogin(username = 'testuser', password = 'testpass123'): Promise<void> {
+  setSessionCookie(await createSession(BASE_URL, { username, password }));
 }
 
-function getHeaders(): HeadersInit {
-  const headers: HeadersInit = { 'Content-Type': 'application/json' };
-  if (sessionCookie) {
-    headers['Cookie'] = sessionCookie;
-  }
-  return headers;
+export function logout(): void {
+  setSessionCookie(null);
 }
 
-export const api: ApiClient = {
-  get: (path: string) => fetch(`${BASE_URL}${path}`, { headers: getHeaders() }),
+export function getSessionCookie(): string | null {
+  return sessionCookie;
+}
 
-  post: (path: string, body?: unknown) => fetch(`${BASE_URL}${path}`, {
-    method: 'POST',
-    headers: getHeaders(),
-    body: body ? JSON.stringify(body) : undefined,
-  }),
+// Node's fetch keeps connections alive and pools them per origin, so we only add retries:
+// idempotent requests that hit a transient gateway error are retried with a short backoff.
+const RETRY_STATUSES = [502, 503, 504];
+const RETRY_METHODS = ['GET', 'HEAD', 'PUT', 'DELETE'];
+const MAX_RETRIES = 2;
+const RETRY_BACKOFF_MS = 100;
 
-  put: (path: string, body?: unknown) => fetch(`${BASE_URL}${path}`, {
-    method: 'PUT',
-    headers: getHeaders(),
+async function request(method: string, path: string, body?: unknown): Promise<Response> {
+  const init: RequestInit = {
+    method,
+    headers,
     body: body ? JSON.stringify(body) : undefined,
-  }),
+  };
 
-  patch: (path: string, body?: unknown) => fetch(`${BASE_URL}${path}`, {
-    method: 'PATCH',
-    headers: getHeaders(),
-    body: body ? JSON.stringify(body) : undefined,
-  }),
+  let response = await fetch(`${BASE_URL}${path}`, init);
+  for (let attempt = 1; attempt <= MAX_RETRIES; attempt++) {
+    if (!RETRY_STATUSES.includes(response.status) || !RETRY_METHODS.includes(method)) {
+      break;
+    }
+    await response.body?.cancel();
+    await new Promise((resolve) => setTimeout(resolve, RETRY_BACKOFF_MS * 2 ** (attempt - 1)));
+    response = await fetch(`${BASE_URL}${path}`, init);
+  }
+  return response;
+}
 
-  delete: (path: string) => fetch(`${BASE_URL}${path}`, {
-    method: 'DELETE',
-    headers: getHeaders(),
-  }),
+export const api: ApiClient = {
+  get: (path: string) => request('GET', path),
+  head: (path: string) => request('HEAD', path),
+  post: (path: string, body?: unknown) => request('POST', path, body),
+  put: (path: string, body?: unknown) => request('PUT', path, body),
+  patch: (path: string, body?: unknown) => request('PATCH', path, body),
+  delete: (path: string) => request('DELETE', path),
 };
 
-export { BASE_URL };
+export { BASE_URL, paths };
@@ -1,8 +1,44 @@
 import { startServer, stopServer, waitForServerReady } from '../helpers/server.js';
-import { createTestUser, REGULAR_USER } from '../helpers/auth.js';
+import {
+  createSession,
+  createTestUser,
+  isSessionValid,
+  type LoginCredentials,
+  REGULAR_USER,
+  TEST_USER,
+} from '../helpers/auth.js';
+import { BASE_URL, paths } from './paths.js';
+import type { GlobalSetupContext } from 'vitest/node';
+import * as os from 'os';
 import * as path from 'path';
 import * as fs from 'fs/promises';
 
+declare module 'vitest' {
+  export interface ProvidedContext {
+    // Session cookies keyed by username, created once for the whole run
+    sessionCookies: Record<string, string>;
+    // IDs most tests need, looked up once instead of per test
+    libraryIds: LibraryIds;
+    // Parsed /api/library listing, for tests that only inspect it
+    libraryTitles: TitleSummary[];
+  }
+}
+
+export interface TitleSummary {
+  id: string;
+  title: string;
+  entries: number;
+  pages: number;
+}
+
+export interface LibraryIds {
+  titleId: string | null; // First title in the library
+  entryIds: string[]; // Entries of that title
+  entryId: string | null; // First of those entries
+  multiTitleId: string | null; // First title with at least two entries
+  multiEntryIds: string[]; // Entries of that title
+}
+
 function getTestDataDir(): string {
   const home = process.env.HOME;
   if (!home) {
@@ -13,7 +49,79 @@ function getTestDataDir(): string {
 
 const TEST_DATA_DIR = getTestDataDir();
 
-export async function setup() {
+// Opt-in for local iteration: keep session cookies between runs so reruns skip logging in.
+// Off by default so CI always starts from a fresh login.
+const REUSE_COOKIES = process.env.MANGO_TESTS_REUSE_COOKIES === '1';
+const COOKIE_CACHE_PATH = path.join(os.homedir(), '.cache', 'mango-rust-tests', 'cookies.json');
+
+async function loadSessions(users: LoginCredentials[]): Promise<Record<string, string>> {
+  let cached: Record<string, string> = {};
+  if (REUSE_COOKIES) {
+    try {
+      cached = JSON.parse(await fs.readFile(COOKIE_CACHE_PATH, 'utf-8'));
+    } catch {
+      // No cache yet (or unreadable), log in normally
+    }
+  }
+
+  const sessions: Record<string, string> = {};
+  for (const user of users) {
+    const cookie = cached[user.username];
+    sessions[user.username] = cookie && await isSessionValid(BASE_URL, cookie)
+      ? cookie
+      : await createSession(BASE_URL, user);
+  }
+
+  if (REUSE_COOKIES) {
+    await fs.mkdir(path.dirname(COOKIE_CACHE_PATH), { recursive: true });
+    await fs.writeFile(COOKIE_CACHE_PATH, JSON.stringify(sessions), 'utf-8');
+  }
+  return sessions;
+}
+
+// Authenticated GET for setup lookups. Redirects are not followed, so a rejected
+// session fails here with the route and status instead of a JSON parse error.
+async function fetchJson<T>(route: string, sessionCookie: string): Promise<T> {
+  const response = await fetch(`${BASE_URL}${route}`, {
+    headers: { Cookie: sessionCookie },
+    redirect: 'manual',
+  });
+  if (!response.ok) {
+    throw new Error(`Setup request GET ${route} failed with status ${response.status}`);
+  }
+  return response.json();
+}
+
+async function fetchLibraryIds(sessionCookie: string, titles: TitleSummary[]): Promise<LibraryIds> {
+  if (titles.length === 0) {
+    return { titleId: null, entryIds: [], entryId: null, multiTitleId: null, multiEntryIds: [] };
+  }
+
+  const fetchEntryIds = async (tid: string): Promise<string[]> => {
+    const title = await fetchJson<{ entries: { id: string }[] }>(paths.title(tid), sessionCookie);
+    return title.entries.map((entry) => entry.id);
+  };
+
+  const titleId: string = titles[0].id;
+  const entryIds = await fetchEntryIds(titleId);
+
+  // Usually the first title already qualifies, which saves the second lookup
+  const multiTitleId = titles.find((t) => t.entries >= 2)?.id ?? null;
+  let multiEntryIds: string[] = [];
+  if (multiTitleId) {
+    multiEntryIds = multiTitleId === titleId ? entryIds : await fetchEntryIds(multiTitleId);
+  }
+
+  return {
+    titleId,
+    entryIds,
+    entryId: entryIds[0] ?? null,
+    multiTitleId,
+    multiEntryIds,
+  };
+}
+
+export async function setup({ provide }: GlobalSetupContext) {
   console.log('Global setup: Starting test environment...');
 
   // Create test directory
@@ -37,6 +145,14 @@ log_level: info
   await createTestUser(dbPath);
   await createTestUser(dbPath, REGULAR_USER, false);
 
+  // Log in once per user; test files reuse these sessions instead of logging in themselves
+  const sessions = await loadSessions([TEST_USER, REGULAR_USER]);
+  provide('sessionCookies', sessions);
+  const adminCookie = sessions[TEST_USER.username];
+  const titles = await fetchJson<TitleSummary[]>(paths.library, adminCookie);
+  provide('libraryTitles', titles);
+  provide('libraryIds', await fetchLibraryIds(adminCookie, titles));
+
   console.log('Global setup: Complete');
 }
 
@@ -0,0 +1,19 @@
+// Server address and API routes, shared by the test client and globalSetup.
+// Kept free of vitest imports so it can also load in the globalSetup process.
+
+// Use explicit port to avoid vitest/vite import.meta.env.BASE_URL conflicts
+const SERVER_PORT = 9000;
+const SERVER_HOST = 'localhost';
+export const BASE_URL = `http://${SERVER_HOST}:${SERVER_PORT}`;
+
+// API routes used by the tests, kept in one place so a route change is a one-line edit
+export const paths = {
+  library: '/api/library',
+  title: (tid: string) => `/api/title/${tid}`,
+  page: (tid: string, eid: string, page: number) => `/api/page/${tid}/${eid}/${page}`,
+  progress: (tid: string, eid: string) => `/api/progress/${tid}/${eid}`,
+  allProgress: '/api/progress',
+  stats: '/api/stats',
+  adminScan: '/api/admin/scan',
+  adminUsers: '/api/admin/users',
+};
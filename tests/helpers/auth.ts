@@ -108,6 +108,48 @@ export async function saveAuthState(
   console.log(`✓ Auth state saved to ${path}`);
 }
 
+/**
+ * Log in over HTTP and return the resulting session cookie
+ * Does not follow the post-login redirect, so this costs a single request
+ * @param baseUrl - Server base URL
+ * @param credentials - Login credentials (defaults to TEST_USER)
+ * @returns The `name=value` pair of the session cookie
+ */
+export async function createSession(
+  baseUrl: string,
+  credentials: LoginCredentials = TEST_USER
+): Promise<string> {
+  const response = await fetch(`${baseUrl}/login`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
+    body: new URLSearchParams({ username: credentials.username, password: credentials.password }),
+    redirect: 'manual',
+  });
+
+  const setCookie = response.headers.get('set-cookie');
+  if (!setCookie) {
+    throw new Error(`Login failed for user '${credentials.username}': no session cookie returned`);
+  }
+
+  return setCookie.split(';')[0];
+}
+
+/**
+ * Check whether a session cookie is still accepted by the server
+ * @param baseUrl - Server base URL
+ * @param sessionCookie - The `name=value` pair of the session cookie
+ * @returns True if the home page is served, false if it redirects to login
+ */
+export async function isSessionValid(baseUrl: string, sessionCookie: string): Promise<boolean> {
+  // HEAD: the status is all we need; the page is still rendered, but not downloaded
+  const response = await fetch(`${baseUrl}/`, {
+    method: 'HEAD',
+    headers: { Cookie: sessionCookie },
+    redirect: 'manual',
+  });
+  return response.status === 200;
+}
+
 /**
  * Create a test user via direct database manipulation
  * This should be called during global setup before tests run
@@ -6,6 +6,8 @@ import { spawn, ChildProcess } from 'child_process';
  */
 
 let serverProcess: ChildProcess | null = null;
+// Set when the spawned process dies, so readiness polling can stop early
+let serverExited = false;
 
 interface ServerConfig {
   port: number;
@@ -40,6 +42,7 @@ export async function startServer(config: Partial<ServerConfig> = {}): Promise<v
   const testDataDir = process.env.HOME + '/test-manga-library';
 
   // Spawn cargo run process
+  serverExited = false;
   serverProcess = spawn('cargo', ['run', '--release'], {
     cwd: process.cwd().replace('/tests', ''), // Run from project root
     env: {
@@ -75,11 +78,13 @@ export async function startServer(config: Partial<ServerConfig> = {}): Promise<v
   });
 
   serverProcess.on('error', (error) => {
+    serverExited = true;
     console.error('Failed to start server process:', error.message);
     throw new Error(`Server startup failed: ${error.message}`);
   });
 
   serverProcess.on('exit', (code) => {
+    serverExited = true;
     if (code !== null && code !== 0) {
       console.error(`Server exited with code ${code}`);
       console.error('Recent logs:', logs.slice(-10).join('\n'));
@@ -115,6 +120,11 @@ export async function waitForServerReady(config: Partial<ServerConfig> = {}): Pr
   let attempt = 0;
 
   while (Date.now() - startTime < cfg.maxStartupTime) {
+    // Fail fast instead of polling a server that can no longer come up
+    if (serverExited) {
+      throw new Error(`Server process exited before becoming ready (${attempt} attempts)`);
+    }
+
     attempt++;
 
     try {
@@ -8,6 +8,8 @@ export default defineConfig({
     globalSetup: ['./api/globalSetup.ts'],
     testTimeout: 10000,
     hookTimeout: 60000,
-    fileParallelism: false, // Run test files sequentially to share server
+    // Test files run in parallel workers against the one server started in globalSetup.
+    // Tests within a file stay sequential, so stateful flows (e.g. progress) keep their order.
+    fileParallelism: true,
   },
 });